@@ -1,23 +1,68 @@
+import asyncio
+import functools
+import hashlib
+import json
 import os
 import logging
+import re
+import textwrap
+import time
+from pathlib import Path
+
+import aiofiles
+import diskcache
+import requests
+from jinja2 import Template
+import wikipedia
 import google.cloud.logging
+from google.cloud.logging.handlers import CloudLoggingHandler, setup_logging
+from google.cloud.logging.handlers.transports import BackgroundThreadTransport
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
+from typing import AsyncGenerator
+
 from google.adk import Agent
-from google.adk.agents import SequentialAgent, LoopAgent, ParallelAgent
+from google.adk.agents import BaseAgent, SequentialAgent, LoopAgent
+from google.adk.agents.callback_context import CallbackContext
+from google.adk.agents.invocation_context import InvocationContext
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.events import Event, EventActions
+from google.adk.models import LlmRequest, LlmResponse
 from google.adk.tools.tool_context import ToolContext
-from google.adk.tools.langchain_tool import LangchainTool
 from google.genai import types
 from google.adk.tools import exit_loop
 
 # Wikipedia utilities
-from langchain_community.tools import WikipediaQueryRun
 from langchain_community.utilities import WikipediaAPIWrapper
 
+from .batch_llm import BatchGeminiLlm
+from .parallel_tools import PARALLEL_TOOL_KWARGS, enable_parallel_tool_execution
+
+# Let multiple tool calls from one model response run concurrently for
+# the research and judge agents only; the verdict writer's chunked
+# write_file calls are order-dependent and must stay sequential. Only
+# wiki_batch is fanned out individually — the other tools write state,
+# and concurrent state deltas would collide
+enable_parallel_tool_execution(
+    ("dual_researcher", "judge_agent"),
+    parallel_safe_tools=("wiki_batch",),
+)
+
 
-# Initialize Cloud Logging
+# Initialize Cloud Logging once per process; re-importing this module
+# (e.g. under a reloading dev server) must not stack duplicate handlers.
+# Records are batched and shipped from a background thread so logging in
+# hot tool code only enqueues to an in-memory buffer instead of making a
+# blocking HTTPS call per record.
 cloud_logging_client = google.cloud.logging.Client()
-cloud_logging_client.setup_logging()
+if not getattr(logging.getLogger(), "_adk_cloud_configured", False):
+    _cloud_handler = CloudLoggingHandler(
+        cloud_logging_client,
+        transport=functools.partial(BackgroundThreadTransport, batch_size=50),
+    )
+    setup_logging(_cloud_handler, log_level=logging.INFO)
+    logging.getLogger()._adk_cloud_configured = True
 
 # Load environment variables
 load_dotenv()
@@ -25,11 +70,40 @@ load_dotenv()
 model_name = os.getenv("MODEL")
 print(f"Using Model: {model_name}")
 
+# Per-agent model routing: the Judge's short balance check suits a
+# smaller/faster model than the researcher or the verdict writer.
+# Each falls back to MODEL when not set.
+research_model = os.getenv("RESEARCH_MODEL", model_name)
+judge_model = os.getenv("JUDGE_MODEL", model_name)
+writer_model = os.getenv("WRITER_MODEL", model_name)
+
+# Offline runs can trade latency for the cheaper Vertex AI batch price
+BATCH_MODE = os.getenv("ADK_BATCH_MODE") == "1"
+if BATCH_MODE:
+    model_name = BatchGeminiLlm(model=model_name)
+    research_model = BatchGeminiLlm(model=research_model)
+    judge_model = BatchGeminiLlm(model=judge_model)
+    writer_model = BatchGeminiLlm(model=writer_model)
+
 
 # =====================================================
 # SECTION 1 — TOOL FUNCTIONS
 # =====================================================
 
+# Bounds on each evidence list, so the prompts rebuilt from state every
+# loop iteration stay a fixed size instead of growing with the iteration
+_MAX_FINDINGS_PER_FIELD = 5
+_MAX_FIELD_CHARS = 4000
+
+
+def _compact_findings(items: list) -> list:
+    """Drop the oldest entries once a state field exceeds its budget."""
+    items = items[-_MAX_FINDINGS_PER_FIELD:]
+    while len(items) > 1 and sum(len(str(i)) for i in items) > _MAX_FIELD_CHARS:
+        items.pop(0)
+    return [str(item)[:_MAX_FIELD_CHARS] for item in items]
+
+
 def append_to_state(
     tool_context: ToolContext, field: str, response: str
 ) -> dict[str, str]:
@@ -43,33 +117,214 @@ def append_to_state(
     if isinstance(existing_state, str):
         existing_state = [existing_state]
 
-    tool_context.state[field] = existing_state + [response]
-    logging.info(f"[State Updated → {field}] {response}")
+    # Append in place instead of copying the whole list on every call;
+    # the reassignment keeps the state backend aware of the mutation
+    existing_state.append(response)
+    tool_context.state[field] = _compact_findings(existing_state)
+
+    # Compaction trims the list itself, so sufficiency checks use a
+    # separate running count of findings ever stored per side
+    if field in ("pos_data", "neg_data"):
+        count_key = f"{field}_count"
+        tool_context.state[count_key] = tool_context.state.get(count_key, 0) + 1
+
+    logging.info("[State Updated → %s] %s", field, response)
     return {"status": "success"}
 
 
-def write_file(
+# The verdict agent always writes into court_records; create it once at
+# import so write_file skips the directory stat on every call
+REPORTS_DIR = Path("court_records")
+REPORTS_DIR.mkdir(exist_ok=True)
+
+
+def _safe_filename(subject: str) -> str:
+    """Turn a subject name into a filesystem-safe report filename."""
+    return re.sub(r"[^A-Za-z0-9_-]", "_", subject)[:120] + ".txt"
+
+
+def _current_subject(state) -> str:
+    """
+    Read the trial subject from state. append_to_state stores PROMPT as
+    a list, so take the most recent entry.
+    """
+    subject = state.get("PROMPT", "")
+    if isinstance(subject, list):
+        subject = subject[-1] if subject else ""
+    return str(subject)
+
+
+async def write_file(
     tool_context: ToolContext,
-    directory: str,
-    filename: str,
-    content: str
+    chunk: str,
+    final: bool = False,
 ) -> dict[str, str]:
     """
-    Save the generated final report into a text file.
+    Append one section of the final report to the current subject's
+    file in court_records without blocking the event loop on disk I/O.
+
+    Called once per section so the report streams to disk as it is
+    generated instead of being buffered whole in a single tool argument.
+    The subject comes from state (the same place the verdict cache reads
+    it), and sections accumulate in a .part file that is renamed into
+    place on final=True, so a half-written report never looks complete.
     """
-    target_path = os.path.join(directory, filename)
-    os.makedirs(os.path.dirname(target_path), exist_ok=True)
-
-    with open(target_path, "w", encoding="utf-8") as f:
-        f.write(content)
+    subject = _current_subject(tool_context.state)
+    target_path = str(REPORTS_DIR / _safe_filename(subject))
+    part_path = target_path + ".part"
+
+    # Paths go through state rather than an open handle so the session
+    # stays serializable between tool calls
+    started = tool_context.state.get("temp:verdict_files", [])
+    mode = "a" if part_path in started else "w"
+
+    async with aiofiles.open(part_path, mode, encoding="utf-8") as f:
+        await f.write(chunk)
+
+    if final:
+        await asyncio.to_thread(os.replace, part_path, target_path)
+        started = [path for path in started if path != part_path]
+        logging.info("[Report completed] %s", target_path)
+    elif mode == "w":
+        started = started + [part_path]
+    tool_context.state["temp:verdict_files"] = started
 
     return {"status": "success"}
 
 
-# Prepare Wikipedia search tool
-wiki_tool = LangchainTool(
-    tool=WikipediaQueryRun(api_wrapper=WikipediaAPIWrapper())
-)
+# Wikipedia lookups. Repeated loop iterations (and the judge's feedback)
+# often re-ask for the same subject, so repeated queries are served from a
+# local cache instead of hitting the Wikipedia API again: an in-process
+# LRU for the hot path, backed by an on-disk cache shared across
+# processes. wiki_batch and research_and_store below both go through it.
+_wiki_disk_cache = diskcache.Cache("./.wiki_cache")
+
+
+@functools.lru_cache(maxsize=1)
+def _wiki_api_wrapper() -> WikipediaAPIWrapper:
+    return WikipediaAPIWrapper()
+
+# The wikipedia client calls requests.get() directly, paying a fresh TCP/TLS
+# handshake per query. Point it at one pooled session for the whole process
+# so connections to en.wikipedia.org are reused across lookups.
+_http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20)
+_http_session.mount("https://", _http_adapter)
+_http_session.mount("http://", _http_adapter)
+wikipedia.wikipedia.requests = _http_session
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_wiki_run(query: str) -> str:
+    cached = _wiki_disk_cache.get(query)
+    if cached is not None:
+        return cached
+    result = _wiki_api_wrapper().run(query)
+    _wiki_disk_cache.set(query, result)
+    return result
+
+
+# Prompt-level response cache. Loop iterations and repeat sessions for the
+# same subject produce identical prompts; those are served from disk instead
+# of paying for a fresh model call. Only plain-text responses are cached, so
+# function-calling turns (exit_loop, write_file, ...) always reach the model.
+_prompt_cache = diskcache.Cache("./.prompt_cache")
+
+
+def _prompt_cache_key(llm_request: LlmRequest) -> str:
+    texts = []
+    if llm_request.config and llm_request.config.system_instruction:
+        texts.append(str(llm_request.config.system_instruction))
+    for content in llm_request.contents or []:
+        for part in content.parts or []:
+            if part.text:
+                texts.append(part.text)
+            # Function calls and responses must be part of the key:
+            # otherwise a turn's first request and its post-tool
+            # continuation hash identically and the wrong one is served
+            elif part.function_call:
+                texts.append(part.function_call.model_dump_json(exclude_none=True))
+            elif part.function_response:
+                texts.append(part.function_response.model_dump_json(exclude_none=True))
+    normalized = "\n".join(texts).strip().lower()
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+    return f"{llm_request.model}:{digest}"
+
+
+def serve_cached_response(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> LlmResponse | None:
+    """
+    Short-circuit the model call when an identical prompt
+    has already been answered.
+    """
+    key = _prompt_cache_key(llm_request)
+    callback_context.state["temp:prompt_cache_key"] = key
+
+    cached = _prompt_cache.get(key)
+    if cached is None:
+        return None
+
+    logging.info("[Prompt cache hit for %s]", callback_context.agent_name)
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=cached)])
+    )
+
+
+def record_model_response(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> None:
+    """Store a fresh text-only model response in the prompt cache."""
+    key = callback_context.state.get("temp:prompt_cache_key")
+    if not key or llm_response.partial:
+        return None
+    if not (llm_response.content and llm_response.content.parts):
+        return None
+    if any(part.function_call for part in llm_response.content.parts):
+        return None
+
+    text = "".join(
+        part.text for part in llm_response.content.parts if part.text
+    )
+    if text.strip():
+        _prompt_cache.set(key, text)
+    return None
+
+
+async def wiki_batch(
+    tool_context: ToolContext, queries: list[str]
+) -> dict[str, list[str]]:
+    """
+    Look up several Wikipedia queries concurrently and return
+    their summaries in the same order as the queries.
+    """
+    results = await asyncio.gather(
+        *[
+            asyncio.to_thread(_cached_wiki_run, query.strip().lower())
+            for query in queries
+        ]
+    )
+    return {"results": list(results)}
+
+
+async def research_and_store(
+    tool_context: ToolContext, field: str, query: str
+) -> dict[str, str]:
+    """
+    Look up a query on Wikipedia and store the summary straight into a
+    state field ('pos_data' or 'neg_data'), so recording a finding costs
+    one tool round-trip instead of a lookup followed by an append.
+    """
+    summary = await asyncio.to_thread(_cached_wiki_run, query.strip().lower())
+    result = append_to_state(tool_context, field, summary)
+
+    # Mark the field so the JSON split ignores the model's paraphrased
+    # echo of findings that were already stored this turn
+    stored_fields = tool_context.state.get("temp:stored_fields", [])
+    if field not in stored_fields:
+        tool_context.state["temp:stored_fields"] = stored_fields + [field]
+
+    return result
 
 
 # =====================================================
@@ -77,57 +332,140 @@ wiki_tool = LangchainTool(
 # =====================================================
 
 # -------------------------------
-# Investigation Stage (Parallel)
+# Investigation Stage (Dual Researcher)
 # -------------------------------
 
-# Agent responsible for collecting positive facts
-admirer_agent = Agent(
-    name="admirer_agent",
-    model=model_name,
-    description="Collects achievements and positive historical contributions.",
-    instruction="""
-    ROLE: You are 'The Admirer'. Focus ONLY on positive aspects, achievements, and contributions.
+def split_dual_findings(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> None:
+    """
+    Split the dual researcher's JSON answer into the
+    'pos_data' and 'neg_data' state lists.
+    """
+    # Under streaming, only the final aggregated response is parseable
+    if llm_response.partial:
+        return None
+    if not (llm_response.content and llm_response.content.parts):
+        return None
+
+    text = "".join(
+        part.text for part in llm_response.content.parts if part.text
+    )
+    if not text.strip():
+        return None
+
+    # The model may fence its JSON in a markdown code block
+    cleaned = text.strip()
+    if cleaned.startswith("```"):
+        cleaned = cleaned.strip("`")
+        if cleaned.startswith("json"):
+            cleaned = cleaned[len("json"):]
+
+    try:
+        findings = json.loads(cleaned)
+    except json.JSONDecodeError:
+        logging.warning("[dual_researcher] response was not valid JSON")
+        return None
+
+    # research_and_store writes straight to state and the JSON answer
+    # paraphrases those findings, so a field stored via tools this turn
+    # is skipped entirely rather than string-matched against paraphrases
+    stored_fields = callback_context.state.get("temp:stored_fields", [])
+
+    for field in ("pos_data", "neg_data"):
+        if field in stored_fields:
+            continue
+        items = findings.get(field, [])
+        if isinstance(items, str):
+            items = [items]
+        existing_state = callback_context.state.get(field, [])
+        if isinstance(existing_state, str):
+            existing_state = [existing_state]
+        new_items = [item for item in items if item not in existing_state]
+        callback_context.state[field] = _compact_findings(
+            existing_state + new_items
+        )
+        count_key = f"{field}_count"
+        callback_context.state[count_key] = (
+            callback_context.state.get(count_key, 0) + len(new_items)
+        )
 
-    SUBJECT: { PROMPT? }
-    CURRENT JUDGE FEEDBACK: { judge_feedback? }
+    if stored_fields:
+        callback_context.state["temp:stored_fields"] = []
 
-    GUIDELINES:
-    - If the Judge provides feedback, refine your search accordingly.
-    - Otherwise, gather key achievements and long-term contributions.
-    - Use the Wikipedia tool for reliable information.
-    - Save results into 'pos_data' using append_to_state.
-    - Keep responses concise and positive.
-    """,
-    tools=[wiki_tool, append_to_state]
-)
+    return None
 
 
-# Agent responsible for collecting negative/critical facts
-critic_agent = Agent(
-    name="critic_agent",
-    model=model_name,
-    description="Collects controversies, criticisms, and negative history.",
-    instruction="""
-    ROLE: You are 'The Critic'. Focus ONLY on controversies, failures, and negative aspects.
+def serve_cached_findings(
+    callback_context: CallbackContext, llm_request: LlmRequest
+) -> LlmResponse | None:
+    """
+    Prompt-cache check for the researcher: a hit skips the model call,
+    so the cached JSON must still be split into state here.
+    """
+    response = serve_cached_response(callback_context, llm_request)
+    if response is not None:
+        split_dual_findings(callback_context, response)
+    return response
 
-    SUBJECT: { PROMPT? }
-    CURRENT JUDGE FEEDBACK: { judge_feedback? }
 
-    GUIDELINES:
-    - If the Judge provides feedback, refine your search accordingly.
-    - Otherwise, search for controversies, failures, crimes, or criticisms.
-    - Use the Wikipedia tool for factual data.
-    - Save results into 'neg_data' using append_to_state.
-    - Keep responses concise and critical-focused.
-    """,
-    tools=[wiki_tool, append_to_state]
-)
+def record_and_split(
+    callback_context: CallbackContext, llm_response: LlmResponse
+) -> None:
+    record_model_response(callback_context, llm_response)
+    return split_dual_findings(callback_context, llm_response)
 
 
-# Run both research agents at the same time
-investigation_team = ParallelAgent(
-    name="investigation_team",
-    sub_agents=[admirer_agent, critic_agent]
+# Instruction templates are compiled once at import and rendered through
+# callable instruction providers, instead of having ADK re-parse the
+# multi-line templates on every model call. The sources are dedented so
+# the indentation whitespace doesn't ride along as prompt tokens.
+_RESEARCHER_TMPL = Template(textwrap.dedent(
+    """
+    ROLE: You are a two-sided court researcher, acting as both
+    'The Admirer' (positive side) and 'The Critic' (negative side).
+
+    SUBJECT: {{ PROMPT }}
+    CURRENT JUDGE FEEDBACK: {{ judge_feedback }}
+
+    GUIDELINES:
+    - If the Judge provides feedback, refine your search accordingly.
+    - Gather achievements and long-term contributions for the positive side.
+    - Gather controversies, failures, crimes, or criticisms for the negative side.
+    - To record a finding, call 'research_and_store' with
+      field='pos_data' or field='neg_data' and the search query;
+      it looks up Wikipedia and stores the result in one step.
+    - Use ONE 'wiki_batch' call with all subqueries when you only need
+      to survey material before deciding what to store.
+    - Keep each finding concise.
+
+    OUTPUT:
+    Respond with ONLY a JSON object of the form:
+    {"pos_data": ["finding", ...], "neg_data": ["finding", ...]}
+    List only findings you did NOT already store with
+    'research_and_store'; empty arrays are fine.
+    """
+))
+
+
+def _researcher_instruction(ctx: ReadonlyContext) -> str:
+    return _RESEARCHER_TMPL.render(
+        PROMPT=_current_subject(ctx.state),
+        judge_feedback=ctx.state.get("judge_feedback", ""),
+    )
+
+
+# One agent collects both sides of the evidence in a single
+# model call instead of two parallel admirer/critic calls.
+dual_researcher = Agent(
+    name="dual_researcher",
+    model=research_model,
+    description="Collects positive and negative historical evidence in one pass.",
+    instruction=_researcher_instruction,
+    tools=[wiki_batch, research_and_store],
+    before_model_callback=serve_cached_findings,
+    after_model_callback=record_and_split,
+    **PARALLEL_TOOL_KWARGS
 )
 
 
@@ -135,18 +473,15 @@ investigation_team = ParallelAgent(
 # Review Stage (Judge + Loop)
 # -------------------------------
 
-judge_agent = Agent(
-    name="judge_agent",
-    model=model_name,
-    description="Evaluates balance and completeness of collected evidence.",
-    instruction="""
+_JUDGE_TMPL = Template(textwrap.dedent(
+    """
     ROLE: You are 'The Judge'. Review the evidence gathered from both sides.
 
     NEGATIVE SIDE:
-    { neg_data? }
+    {{ neg_data }}
 
     POSITIVE SIDE:
-    { pos_data? }
+    {{ pos_data }}
 
     TASK:
     1. Compare both sides in terms of completeness and balance.
@@ -156,18 +491,88 @@ judge_agent = Agent(
          -> Continue the loop (do NOT exit).
        - If both sides are sufficiently detailed and balanced:
          -> Use 'exit_loop' to finish the trial phase.
-    """,
-    tools=[append_to_state, exit_loop]
+    """
+))
+
+
+def _judge_instruction(ctx: ReadonlyContext) -> str:
+    return _JUDGE_TMPL.render(
+        neg_data=ctx.state.get("neg_data", []),
+        pos_data=ctx.state.get("pos_data", []),
+    )
+
+
+judge_agent = Agent(
+    name="judge_agent",
+    model=judge_model,
+    description="Evaluates balance and completeness of collected evidence.",
+    instruction=_judge_instruction,
+    tools=[append_to_state, exit_loop],
+    before_model_callback=serve_cached_response,
+    after_model_callback=record_model_response,
+    **PARALLEL_TOOL_KWARGS
 )
 
 
+# Evidence thresholds that let the loop finish without an LLM judge call
+_MIN_FINDINGS_PER_SIDE = 3
+_MIN_TOTAL_EVIDENCE_CHARS = 2000
+
+
+class HeuristicJudge(BaseAgent):
+    """
+    Puts a deterministic sufficiency check in front of the LLM judge:
+    when both sides already hold enough evidence, exit the trial loop
+    directly instead of spending a model call on the decision.
+    """
+
+    judge: Agent
+
+    def __init__(self, name: str, judge: Agent):
+        super().__init__(name=name, judge=judge, sub_agents=[judge])
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        pos_data = ctx.session.state.get("pos_data", [])
+        neg_data = ctx.session.state.get("neg_data", [])
+        total_chars = sum(len(str(item)) for item in pos_data + neg_data)
+
+        # _compact_findings trims the lists themselves, so sufficiency is
+        # measured against the running counters of findings ever stored
+        pos_count = ctx.session.state.get("pos_data_count", len(pos_data))
+        neg_count = ctx.session.state.get("neg_data_count", len(neg_data))
+
+        if (
+            pos_count >= _MIN_FINDINGS_PER_SIDE
+            and neg_count >= _MIN_FINDINGS_PER_SIDE
+            and total_chars > _MIN_TOTAL_EVIDENCE_CHARS
+        ):
+            yield Event(
+                author=self.name,
+                actions=EventActions(escalate=True),
+                content=types.Content(
+                    role="model",
+                    parts=[types.Part(
+                        text="Evidence is sufficient on both sides; "
+                             "ending the trial phase."
+                    )]
+                )
+            )
+            return
+
+        # Ambiguous cases still go to the LLM judge
+        async for event in self.judge.run_async(ctx):
+            yield event
+
+
 # Loop combines investigation and evaluation until completion
 trial_process = LoopAgent(
     name="trial_process",
     description="Repeats investigation and review until balanced.",
     sub_agents=[
-        investigation_team,
-        judge_agent
+        dual_researcher,
+        HeuristicJudge(name="trial_judge", judge=judge_agent)
     ],
     max_iterations=4  # Safety limit to prevent endless looping
 )
@@ -177,16 +582,13 @@ trial_process = LoopAgent(
 # Final Report Generation
 # -------------------------------
 
-verdict_writer = Agent(
-    name="verdict_writer",
-    model=model_name,
-    description="Produces a balanced final historical report.",
-    instruction="""
+_WRITER_TMPL = Template(textwrap.dedent(
+    """
     ROLE: Court Clerk responsible for writing the final verdict.
 
-    SUBJECT: { PROMPT? }
-    POSITIVE EVIDENCE: { pos_data? }
-    NEGATIVE EVIDENCE: { neg_data? }
+    SUBJECT: {{ PROMPT }}
+    POSITIVE EVIDENCE: {{ pos_data }}
+    NEGATIVE EVIDENCE: {{ neg_data }}
 
     REQUIREMENTS:
     - Produce a neutral and balanced historical report.
@@ -194,12 +596,30 @@ verdict_writer = Agent(
     - Present positive contributions.
     - Present criticisms and controversies.
     - Conclude with an objective summary of historical impact.
-    - Save the report using 'write_file':
-        directory: "court_records"
-        filename: "{PROMPT}.txt"
-        content: full report
-    """,
-    tools=[write_file]
+    - Save the report with one 'write_file' call per section
+      (overview, positive contributions, criticisms, conclusion):
+        chunk: the section text
+        final: true on the LAST section only
+    """
+))
+
+
+def _writer_instruction(ctx: ReadonlyContext) -> str:
+    return _WRITER_TMPL.render(
+        PROMPT=_current_subject(ctx.state),
+        pos_data=ctx.state.get("pos_data", []),
+        neg_data=ctx.state.get("neg_data", []),
+    )
+
+
+verdict_writer = Agent(
+    name="verdict_writer",
+    model=writer_model,
+    description="Produces a balanced final historical report.",
+    instruction=_writer_instruction,
+    tools=[write_file],
+    before_model_callback=serve_cached_response,
+    after_model_callback=record_model_response
 )
 
 
@@ -207,6 +627,52 @@ verdict_writer = Agent(
 # SECTION 3 — ROOT AGENT (ENTRY POINT)
 # =====================================================
 
+# How long a finished report stays valid before a repeat subject
+# triggers a fresh trial
+_VERDICT_TTL_SECONDS = int(os.getenv("VERDICT_TTL_SECONDS", 7 * 24 * 3600))
+
+
+class CachedVerdictGate(BaseAgent):
+    """
+    Serves the previously written court_records report when the same
+    subject is requested again within the TTL, skipping the whole trial
+    and verdict pipeline; everything else is delegated to the court.
+    """
+
+    court: BaseAgent
+
+    def __init__(self, name: str, court: BaseAgent):
+        super().__init__(name=name, court=court, sub_agents=[court])
+
+    async def _run_async_impl(
+        self, ctx: InvocationContext
+    ) -> AsyncGenerator[Event, None]:
+        subject = _current_subject(ctx.session.state)
+
+        # write_file only renames a report to its final name once the
+        # last section lands, so an existing file is a complete report
+        report_path = REPORTS_DIR / _safe_filename(subject)
+        if (
+            subject
+            and report_path.exists()
+            and time.time() - report_path.stat().st_mtime < _VERDICT_TTL_SECONDS
+        ):
+            logging.info("[Verdict cache hit] %s", report_path)
+            content = await asyncio.to_thread(
+                report_path.read_text, encoding="utf-8"
+            )
+            yield Event(
+                author=self.name,
+                content=types.Content(
+                    role="model", parts=[types.Part(text=content)]
+                )
+            )
+            return
+
+        async for event in self.court.run_async(ctx):
+            yield event
+
+
 root_agent = Agent(
     name="historical_court_clerk",
     model=model_name,
@@ -218,13 +684,18 @@ root_agent = Agent(
     - Then proceed to the full court process.
     """,
     tools=[append_to_state],
+    before_model_callback=serve_cached_response,
+    after_model_callback=record_model_response,
     sub_agents=[
-        SequentialAgent(
-            name="court_system",
-            sub_agents=[
-                trial_process,
-                verdict_writer
-            ]
+        CachedVerdictGate(
+            name="court_gate",
+            court=SequentialAgent(
+                name="court_system",
+                sub_agents=[
+                    trial_process,
+                    verdict_writer
+                ]
+            )
         )
     ]
 )
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+
+from google.adk.agents.llm_agent import LlmAgent
+from google.adk.flows.llm_flows import functions as llm_functions
+
+
+def _native_flag_supported() -> bool:
+    return "enable_parallel_tool_execution" in getattr(
+        LlmAgent, "model_fields", {}
+    )
+
+
+# Extra Agent kwargs to apply when ADK ships the flag natively; empty on
+# older versions, where the monkey-patch below provides the behavior
+PARALLEL_TOOL_KWARGS = (
+    {"enable_parallel_tool_execution": True} if _native_flag_supported() else {}
+)
+
+
+def _merge_events(events):
+    merged = events[0]
+    for extra in events[1:]:
+        merged.content.parts.extend(extra.content.parts)
+        merged.actions.state_delta.update(extra.actions.state_delta)
+        merged.actions.artifact_delta.update(extra.actions.artifact_delta)
+        if extra.actions.escalate:
+            merged.actions.escalate = True
+        if extra.actions.transfer_to_agent:
+            merged.actions.transfer_to_agent = extra.actions.transfer_to_agent
+    return merged
+
+
+def enable_parallel_tool_execution(
+    agent_names: tuple[str, ...], parallel_safe_tools: tuple[str, ...]
+) -> None:
+    """
+    Run the tool calls from one model response concurrently for the
+    named agents.
+
+    When a single LLM turn emits several function calls (e.g. two
+    Wikipedia lookups), ADK executes them sequentially, so the turn costs
+    the sum of the tool latencies instead of the slowest one. On ADK
+    versions without the native enable_parallel_tool_execution flag, this
+    replaces the function-call handler with one that fans calls out
+    through asyncio.gather and merges the response events. Only the
+    agents in agent_names are affected, mirroring where the native flag
+    is applied; agents with order-dependent or non-idempotent tools
+    (e.g. the verdict writer's chunked write_file) keep sequential
+    execution.
+
+    Only calls to parallel_safe_tools (tools that never write state) are
+    fanned out individually. State-writing calls would each read the
+    pre-turn state and produce colliding state deltas on shared keys
+    (evidence lists, counters, temp markers), where the last-wins merge
+    silently drops updates — so all of a turn's state-writing calls go
+    to the stock handler together in one batch, preserving its exact
+    semantics, and run concurrently with the safe fan-out.
+    """
+    if PARALLEL_TOOL_KWARGS:
+        # Native support: the flag on each Agent already does this
+        return
+
+    original = llm_functions.handle_function_calls_async
+
+    async def handle_function_calls_parallel(
+        invocation_context, function_call_event, tools_dict, *args, **kwargs
+    ):
+        call_parts = [
+            part
+            for part in function_call_event.content.parts
+            if part.function_call
+        ]
+        safe_parts = [
+            part
+            for part in call_parts
+            if part.function_call.name in parallel_safe_tools
+        ]
+        if (
+            invocation_context.agent.name not in agent_names
+            or len(call_parts) <= 1
+            or not safe_parts
+        ):
+            return await original(
+                invocation_context, function_call_event, tools_dict,
+                *args, **kwargs
+            )
+
+        stateful_parts = [
+            part for part in call_parts if part not in safe_parts
+        ]
+
+        async def run_batch(parts):
+            batch_event = function_call_event.model_copy(deep=True)
+            batch_event.content.parts = list(parts)
+            return await original(
+                invocation_context, batch_event, tools_dict, *args, **kwargs
+            )
+
+        # One batch per safe call, plus a single batch holding every
+        # state-writing call so their deltas never race each other
+        batches = [[part] for part in safe_parts]
+        if stateful_parts:
+            batches.append(stateful_parts)
+
+        responses = await asyncio.gather(
+            *[run_batch(batch) for batch in batches]
+        )
+        events = [event for event in responses if event is not None]
+        if not events:
+            return None
+        return _merge_events(events)
+
+    llm_functions.handle_function_calls_async = handle_function_calls_parallel
+    logging.info("[Parallel tool execution enabled via patched handler]")